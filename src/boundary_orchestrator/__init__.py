@@ -0,0 +1,19 @@
+"""
+Python boundary orchestrator around Krypton entropy decisions.
+
+Submodules are imported lazily on attribute access, so `import
+boundary_orchestrator` stays cheap for callers that only need one of them.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+_LAZY_SUBMODULES = ("cli", "config", "krypton_client", "scheduler")
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
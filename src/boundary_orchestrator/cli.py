@@ -1,32 +1,41 @@
 from __future__ import annotations
 
-import argparse
-import json
+import os
 import sys
-from typing import Any, Dict
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Callable, Dict, Tuple
 
+import orjson
+
+from . import krypton_client
 from .config import load_config
-from .krypton_client import fetch as fetch_krypton
 from .scheduler import (
     JobRegistry,
+    emit_json,
+    health_to_dict,
     print_result,
     run_once,
     run_registered_once,
 )
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    import argparse
+
 # Simple version constant for CLI reporting.
 VERSION = "0.1.0"
 
 
-def _print_json(obj: Dict[str, Any]) -> None:
-    print(json.dumps(obj, indent=2, sort_keys=True))
-
-
 # ---- Jobs used by the CLI -------------------------------------------------
 
 
 def _dummy_job() -> None:
-    print("dummy_job executed")
+    sys.stdout.write("dummy_job executed\n")
+
+
+def _silent_job() -> None:
+    """
+    No-op stand-in for the dummy job, for benchmarking the scheduler loop.
+    """
 
 
 def _gateway_job() -> None:
@@ -36,8 +45,6 @@ def _gateway_job() -> None:
     This is intentionally simple: it assumes the gateway is listening on
     http://127.0.0.1:8080 and that POST /jobs is available.
     """
-    import requests  # local import to avoid hard dependency at import time
-
     url = "http://127.0.0.1:8080/jobs"
     payload = {
         "job_id": "orchestrated-job",
@@ -45,13 +52,21 @@ def _gateway_job() -> None:
     }
 
     try:
-        resp = requests.post(url, json=payload, timeout=1.0)
+        resp = krypton_client.get_session().post(url, json=payload, timeout=1.0)
         resp.raise_for_status()
         data = resp.json()
-        print("[gateway-job] /jobs response:")
-        _print_json(data)
     except Exception as exc:  # noqa: BLE001
         print(f"[gateway-job] error calling {url!r}: {exc!r}", file=sys.stderr)
+        return
+
+    print("[gateway-job] /jobs response:")
+    try:
+        emit_json(data, sort_keys=True)
+    except orjson.JSONEncodeError as exc:
+        print(
+            f"[gateway-job] could not render /jobs response as JSON: {exc!r}",
+            file=sys.stderr,
+        )
 
 
 def _build_registry() -> JobRegistry:
@@ -60,29 +75,56 @@ def _build_registry() -> JobRegistry:
     """
     return JobRegistry(
         jobs={
-            "dummy": _dummy_job,
+            "dummy": (
+                _silent_job if os.environ.get("KBO_DUMMY_SILENT") == "1" else _dummy_job
+            ),
             "gateway": _gateway_job,
         }
     )
 
 
+_REGISTRY: JobRegistry | None = None
+
+
+def _registry() -> JobRegistry:
+    """
+    Return the CLI job registry, building it on first use.
+    """
+    global _REGISTRY
+    if _REGISTRY is None:
+        _REGISTRY = _build_registry()
+    return _REGISTRY
+
+
 # ---- Command implementations ----------------------------------------------
 
 
+# Closed key sets for `run-loop` telemetry; counts are kept in lists indexed
+# by position and only turned into dicts for the summary. Both are in
+# alphabetical order so the summary JSON needs no key sorting.
+_DECISIONS: Tuple[str, ...] = ("Keep", "Kill", "Throttle")
+_ACTIONS: Tuple[str, ...] = ("run", "skipped", "throttled")
+
+# Action index used for known "Keep" and for unknown decisions alike.
+_RUN_IDX = _ACTIONS.index("run")
+
+# Krypton decision -> (decision index, action index, whether the job runs).
+# Indices are derived from the tuples above so reordering them stays safe.
+_DECISION_ACTIONS: Dict[str, Tuple[int, int, bool]] = {
+    "Keep": (_DECISIONS.index("Keep"), _RUN_IDX, True),
+    "Kill": (_DECISIONS.index("Kill"), _ACTIONS.index("skipped"), False),
+    "Throttle": (_DECISIONS.index("Throttle"), _ACTIONS.index("throttled"), True),
+}
+
+# Maximum number of Krypton snapshots `run-loop` requests per round-trip.
+_FETCH_BATCH_SIZE = 64
+
+
 def cmd_health(_args: argparse.Namespace) -> int:
     """
     Print a single Krypton health snapshot as JSON.
     """
-    health = fetch_krypton()
-    _print_json(
-        {
-            "samples": health.samples,
-            "mean": health.mean,
-            "variance": health.variance,
-            "jitter": health.jitter,
-            "decision": health.decision,
-        }
-    )
+    emit_json(health_to_dict(krypton_client.fetch()))
     return 0
 
 
@@ -91,7 +133,7 @@ def cmd_run_once(_args: argparse.Namespace) -> int:
     Run a single iteration of the scheduler with the dummy job.
     """
     cfg = load_config().scheduler
-    health, action = run_once(_dummy_job, scheduler_cfg=cfg)
+    health, action = run_once(_registry().get("dummy"), scheduler_cfg=cfg)
     print_result(health, action)
     return 0
 
@@ -104,7 +146,7 @@ def cmd_run_job(args: argparse.Namespace) -> int:
       krypton-boundary-orchestrator run-job --job-id gateway
       krypton-boundary-orchestrator run-job --job-id dummy
     """
-    registry = _build_registry()
+    registry = _registry()
     cfg = load_config().scheduler
 
     try:
@@ -127,9 +169,10 @@ def cmd_run_loop(args: argparse.Namespace) -> int:
 
     Example:
       krypton-boundary-orchestrator run-loop --job-id gateway --iterations 10
+      krypton-boundary-orchestrator run-loop --job-id dummy --iterations 10000 --silent
     """
-    registry = _build_registry()
-    cfg = load_config().scheduler
+    registry = _registry()
+    client = krypton_client.get_client(load_config())
 
     try:
         job = registry.get(args.job_id)
@@ -137,57 +180,70 @@ def cmd_run_loop(args: argparse.Namespace) -> int:
         print(f"[run-loop] {exc}", file=sys.stderr)
         return 1
 
+    if args.silent and args.job_id == "dummy":
+        job = _silent_job
+
     iterations = args.iterations
 
-    decision_counts: Dict[str, int] = {"Keep": 0, "Throttle": 0, "Kill": 0}
-    action_counts: Dict[str, int] = {"run": 0, "throttled": 0, "skipped": 0}
+    decision_counts = [0] * len(_DECISIONS)
+    action_counts = [0] * len(_ACTIONS)
+    # Decisions outside the known set still run the job and are reported as-is.
+    other_decisions: Dict[str, int] = {}
 
     last_health = None
 
-    for _ in range(iterations):
-        from .krypton_client import fetch as fetch_k  # local import for clarity
-
-        health = fetch_k()
-        last_health = health
-
-        if health.decision == "Kill":
-            action = "skipped"
-        elif health.decision == "Throttle":
-            action = "throttled"
-            job()
-        else:
-            action = "run"
-            job()
-
-        decision_counts[health.decision] = decision_counts.get(
-            health.decision,
-            0,
-        ) + 1
-        action_counts[action] = action_counts.get(action, 0) + 1
-
+    # Pull snapshots in bounded batches to cut round-trips to Krypton. Each
+    # batch is taken when it is requested, so a decision can lag by at most
+    # one batch worth of job runs.
+    remaining = iterations
+    while remaining > 0:
+        batch = client.fetch_many(min(remaining, _FETCH_BATCH_SIZE))
+        remaining -= len(batch)
+
+        for health in batch:
+            entry = _DECISION_ACTIONS.get(health.decision)
+            if entry is None:
+                other_decisions[health.decision] = (
+                    other_decisions.get(health.decision, 0) + 1
+                )
+                action_counts[_RUN_IDX] += 1
+                job()
+                continue
+
+            decision_idx, action_idx, should_run = entry
+            decision_counts[decision_idx] += 1
+            action_counts[action_idx] += 1
+            if should_run:
+                job()
+
+        last_health = batch[-1]
+
+    decisions = dict(zip(_DECISIONS, decision_counts))
+    if other_decisions:
+        decisions = dict(sorted({**decisions, **other_decisions}.items()))
+
+    # Keys inserted in alphabetical order (see `emit_json`).
     summary: Dict[str, Any] = {
+        "actions": dict(zip(_ACTIONS, action_counts)),
+        "decisions": decisions,
         "iterations": iterations,
-        "decisions": decision_counts,
-        "actions": action_counts,
     }
 
     if last_health is not None:
-        summary["last_health"] = {
-            "samples": last_health.samples,
-            "mean": last_health.mean,
-            "variance": last_health.variance,
-            "jitter": last_health.jitter,
-            "decision": last_health.decision,
-        }
+        summary["last_health"] = health_to_dict(last_health)
 
-    _print_json(summary)
+    emit_json(summary)
     return 0
 
 
 # ---- Argument parsing / entrypoint ----------------------------------------
 
 
-def build_parser() -> argparse.ArgumentParser:
+def _base_parser() -> argparse.ArgumentParser:
+    # argparse is only needed for help, errors and unusual spellings; the
+    # common invocations are handled by `_parse_fast` without importing it.
+    import argparse
+
     parser = argparse.ArgumentParser(
         prog="krypton-boundary-orchestrator",
         description="Python boundary orchestrator around Krypton entropy decisions.",
@@ -197,55 +253,174 @@ def build_parser() -> argparse.ArgumentParser:
         action="version",
         version=f"krypton-boundary-orchestrator {VERSION}",
     )
+    return parser
 
-    subparsers = parser.add_subparsers(dest="command", required=True)
-
-    # health
-    p_health = subparsers.add_parser("health", help="Show a single Krypton health snapshot.")
-    p_health.set_defaults(func=cmd_health)
-
-    # run-once
-    p_run_once = subparsers.add_parser(
-        "run-once",
-        help="Run a single iteration with the dummy job.",
-    )
-    p_run_once.set_defaults(func=cmd_run_once)
 
-    # run-job
-    p_run_job = subparsers.add_parser(
-        "run-job",
-        help="Run a single iteration using a job from the registry.",
-    )
-    p_run_job.add_argument(
+def _add_run_job_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
         "--job-id",
         required=True,
         help="Job identifier to execute (e.g. 'dummy', 'gateway').",
     )
-    p_run_job.set_defaults(func=cmd_run_job)
 
-    # run-loop
-    p_run_loop = subparsers.add_parser(
-        "run-loop",
-        help="Run multiple iterations and emit basic telemetry.",
-    )
-    p_run_loop.add_argument(
+
+def _add_run_loop_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
         "--job-id",
         required=True,
         help="Job identifier to execute on Keep/Throttle (e.g. 'gateway').",
     )
-    p_run_loop.add_argument(
+    p.add_argument(
         "--iterations",
         type=int,
         default=10,
         help="Number of iterations to run (default: 10).",
     )
-    p_run_loop.set_defaults(func=cmd_run_loop)
+    p.add_argument(
+        "--silent",
+        action="store_true",
+        help="Replace the dummy job with a no-op (only affects --job-id dummy).",
+    )
+
+
+# name -> (help, handler, argument builder)
+_SUBCOMMANDS: Dict[
+    str,
+    Tuple[
+        str,
+        Callable[[argparse.Namespace], int],
+        Callable[[argparse.ArgumentParser], None] | None,
+    ],
+] = {
+    "health": ("Show a single Krypton health snapshot.", cmd_health, None),
+    "run-once": ("Run a single iteration with the dummy job.", cmd_run_once, None),
+    "run-job": (
+        "Run a single iteration using a job from the registry.",
+        cmd_run_job,
+        _add_run_job_args,
+    ),
+    "run-loop": (
+        "Run multiple iterations and emit basic telemetry.",
+        cmd_run_loop,
+        _add_run_loop_args,
+    ),
+}
+
+
+def build_parser(only: str | None = None) -> argparse.ArgumentParser:
+    """
+    Build the CLI parser.
+
+    Every subcommand is registered with its name and help text, but only the
+    arguments of `only` are materialized when it is given (none for an empty
+    string). With `only=None` the full parser is built.
+    """
+    parser = _base_parser()
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    for name, (help_text, handler, add_args) in _SUBCOMMANDS.items():
+        p = subparsers.add_parser(name, help=help_text)
+        p.set_defaults(func=handler)
+        if add_args is not None and (only is None or only == name):
+            add_args(p)
 
     return parser
 
 
+def _find_command(argv: list[str]) -> str:
+    """
+    Return the subcommand named in argv, or "" if there is none.
+
+    The top-level parser has no options that take values, so the first
+    non-option token is the subcommand.
+    """
+    for token in argv:
+        if not token.startswith("-"):
+            return token
+    return ""
+
+
+# Per-subcommand flags for the fast path: flag -> (dest, converter). A
+# converter of None marks a boolean switch that takes no value.
+_FAST_FLAGS: Dict[str, Dict[str, Tuple[str, Callable[[str], Any] | None]]] = {
+    "health": {},
+    "run-once": {},
+    "run-job": {"--job-id": ("job_id", str)},
+    "run-loop": {
+        "--job-id": ("job_id", str),
+        "--iterations": ("iterations", int),
+        "--silent": ("silent", None),
+    },
+}
+
+# Flags with defaults; every other flag in `_FAST_FLAGS` is required.
+_FAST_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    "run-loop": {"iterations": 10, "silent": False},
+}
+
+
+def _parse_fast(argv: list[str]) -> SimpleNamespace | None:
+    """
+    Parse a well-formed invocation without building an argparse parser.
+
+    Returns None for anything else (help, unknown commands or flags, missing
+    or invalid values), so argparse can produce its usual output for it.
+    """
+    if not argv or argv[0] not in _FAST_FLAGS:
+        return None
+
+    command = argv[0]
+    flags = _FAST_FLAGS[command]
+    values: Dict[str, Any] = dict(_FAST_DEFAULTS.get(command, {}))
+
+    rest = argv[1:]
+    i = 0
+    while i < len(rest):
+        flag, sep, value = rest[i].partition("=")
+        if flag not in flags:
+            return None
+        dest, convert = flags[flag]
+        if convert is None:
+            if sep:
+                return None
+            values[dest] = True
+            i += 1
+            continue
+        if not sep:
+            i += 1
+            if i == len(rest) or rest[i].startswith("-"):
+                return None
+            value = rest[i]
+        try:
+            values[dest] = convert(value)
+        except ValueError:
+            return None
+        i += 1
+
+    if len(values) != len(flags):
+        return None
+
+    return SimpleNamespace(command=command, func=_SUBCOMMANDS[command][1], **values)
+
+
 def main(argv: list[str] | None = None) -> int:
-    parser = build_parser()
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if argv == ["--version"]:
+        print(f"krypton-boundary-orchestrator {VERSION}")
+        return 0
+
+    fast_args = _parse_fast(argv)
+    if fast_args is not None:
+        return fast_args.func(fast_args)
+
+    command = _find_command(argv)
+    if not command and "--version" in argv:
+        # Version reporting needs no subparsers at all.
+        _base_parser().parse_args(argv)
+
+    parser = build_parser(only=command)
     args = parser.parse_args(argv)
     func = getattr(args, "func", None)
     if func is None:
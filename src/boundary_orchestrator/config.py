@@ -14,6 +14,8 @@ Config file (TOML), e.g. `boundary-orchestrator.toml`:
 
 from __future__ import annotations
 
+import functools
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Literal, Any
@@ -27,19 +29,19 @@ except ModuleNotFoundError:  # pragma: no cover - Python >= 3.11
 KryptonMode = Literal["binary", "http"]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class KryptonConfig:
     mode: KryptonMode
     binary_path: str
     http_url: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SchedulerConfig:
     throttle_sleep_seconds: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OrchestratorConfig:
     krypton: KryptonConfig
     scheduler: SchedulerConfig
@@ -63,10 +65,22 @@ def load_config(path: str | Path | None = None) -> OrchestratorConfig:
     Load config from the given TOML file, or fall back to safe defaults.
 
     If the file does not exist or cannot be parsed, returns a default config.
+
+    Results are cached per absolute path, so repeated calls (e.g. one per
+    fetch in `run-loop`) do not re-read the file, and `None`, a relative
+    string and a `Path` naming the same file share one (frozen) instance.
+    Use `load_config.cache_clear()` to force a reload.
     """
     if path is None:
         path = "boundary-orchestrator.toml"
 
+    # Absolute path as the key: equivalent spellings hit the same entry, and
+    # a later chdir() cannot return another directory's config.
+    return _load_config_cached(os.path.abspath(path))
+
+
+@functools.lru_cache(maxsize=4)
+def _load_config_cached(path: str) -> OrchestratorConfig:
     cfg_path = Path(path)
 
     if not cfg_path.exists():
@@ -92,3 +106,7 @@ def load_config(path: str | Path | None = None) -> OrchestratorConfig:
     )
 
     return OrchestratorConfig(krypton=krypton, scheduler=scheduler)
+
+
+# Expose the cache controls on the public entry point (used by tests).
+load_config.cache_clear = _load_config_cached.cache_clear  # type: ignore[attr-defined]
@@ -39,21 +39,57 @@ HTTP mode is tolerant of two shapes:
 
 from __future__ import annotations
 
-import json
-import subprocess
+import atexit
+import operator
 import sys
 from dataclasses import dataclass
-from typing import Literal, Any
+from typing import TYPE_CHECKING, Callable, Dict, List, Literal, Set, Any
 
-import requests
+import orjson
 
 from .config import OrchestratorConfig, load_config
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    import requests
+
 
 Decision = Literal["Keep", "Throttle", "Kill"]
 
 
-@dataclass
+# Shared HTTP session so repeated fetches (e.g. in `run-loop`) and gateway
+# jobs reuse a keep-alive connection instead of opening a new one per call.
+# Created on first use so binary mode never pays for importing `requests`.
+_SESSION: requests.Session | None = None
+
+# Host pools kept per adapter: one for the health endpoint and one for the
+# gateway, so alternating between them does not evict either connection.
+_POOL_CONNECTIONS = 2
+_POOL_MAXSIZE = 4
+
+
+def get_session() -> requests.Session:
+    """
+    Return the process-wide pooled `requests.Session` (health fetches and gateway jobs).
+    """
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        for prefix in ("http://", "https://"):
+            session.mount(
+                prefix,
+                HTTPAdapter(
+                    pool_connections=_POOL_CONNECTIONS,
+                    pool_maxsize=_POOL_MAXSIZE,
+                ),
+            )
+        _SESSION = session
+    return _SESSION
+
+
+@dataclass(slots=True, frozen=True)
 class KryptonHealth:
     samples: int
     mean: float
@@ -73,17 +109,173 @@ def _stub_health() -> KryptonHealth:
     )
 
 
+# Fetches all five health fields in one C-level call for well-formed payloads.
+_PAYLOAD_FIELDS = operator.itemgetter("samples", "mean", "variance", "jitter", "decision")
+
+
 def _from_payload(payload: dict[str, Any]) -> KryptonHealth:
+    try:
+        samples, mean, variance, jitter, decision = _PAYLOAD_FIELDS(payload)
+    except (KeyError, TypeError):
+        pass
+    else:
+        return KryptonHealth(
+            int(samples),
+            float(mean),
+            float(variance),
+            float(jitter),
+            decision,
+        )
+
+    # Partial payloads: fill in missing fields with defaults.
+    g = payload.get
     return KryptonHealth(
-        samples=int(payload.get("samples", 0)),
-        mean=float(payload.get("mean", 0.0)),
-        variance=float(payload.get("variance", 0.0)),
-        jitter=float(payload.get("jitter", 0.0)),
-        decision=payload.get("decision", "Keep"),  # type: ignore[arg-type]
+        samples=int(g("samples", 0)),
+        mean=float(g("mean", 0.0)),
+        variance=float(g("variance", 0.0)),
+        jitter=float(g("jitter", 0.0)),
+        decision=g("decision", "Keep"),  # type: ignore[arg-type]
     )
 
 
-def _fetch_via_binary(cfg: OrchestratorConfig) -> KryptonHealth:
+def _last_line(out: bytes) -> bytes:
+    """
+    Return the last non-blank line of `out`, without copying the rest of it.
+    """
+    end = len(out)
+    while end:
+        start = out.rfind(b"\n", 0, end) + 1
+        line = out[start:end].strip()
+        if line:
+            return line
+        end = max(start - 1, 0)
+    return b""
+
+
+# How long to wait for a streaming binary to exit after SIGTERM before killing it.
+_STREAM_CLOSE_TIMEOUT_SECONDS = 1.0
+
+
+class _BinaryClient:
+    """
+    Long-lived `entropy_health --stream` process.
+
+    Request/response over pipes: for every newline written to its stdin, the
+    binary takes a fresh snapshot and prints it as one JSON line on stdout.
+    Snapshots are therefore never queued ahead of time, so a decision is
+    always taken when it was asked for. If the binary exits or prints
+    something that is not a JSON object (e.g. it does not understand
+    `--stream`), the client stops streaming and callers fall back to
+    one-shot invocations.
+    """
+
+    def __init__(self, binary_path: str) -> None:
+        import subprocess
+
+        self.binary_path = binary_path
+        self.streaming = True
+        self._proc = subprocess.Popen(
+            [binary_path, "--stream"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        atexit.register(self.close)
+
+    def request(self, n: int) -> bool:
+        """
+        Ask the binary for `n` snapshots; False if streaming is unavailable.
+        """
+        if not self.streaming:
+            return False
+
+        assert self._proc.stdin is not None
+        try:
+            self._proc.stdin.write(b"\n" * n)
+            self._proc.stdin.flush()
+        except OSError:  # e.g. BrokenPipeError once the binary has exited
+            self.close()
+            return False
+        return True
+
+    def read(self) -> KryptonHealth | None:
+        """
+        Read the next requested snapshot, or None if streaming is unavailable.
+        """
+        if not self.streaming:
+            return None
+
+        assert self._proc.stdout is not None
+        line = self._proc.stdout.readline()
+
+        try:
+            payload = orjson.loads(line) if line else None
+        except orjson.JSONDecodeError:
+            payload = None
+
+        if not isinstance(payload, dict):
+            self.close()
+            return None
+
+        return _from_payload(payload)
+
+    def close(self) -> None:
+        import subprocess
+
+        self.streaming = False
+        if self._proc.poll() is None:
+            self._proc.terminate()
+            try:
+                self._proc.wait(timeout=_STREAM_CLOSE_TIMEOUT_SECONDS)
+            except subprocess.TimeoutExpired:
+                # The binary ignored SIGTERM; don't hang the CLI on exit.
+                self._proc.kill()
+                self._proc.wait()
+        for pipe in (self._proc.stdin, self._proc.stdout):
+            if pipe is not None:
+                try:
+                    pipe.close()
+                except OSError:  # unflushed requests to an exited binary
+                    pass
+
+
+# One streaming client per binary path, started on the first batched
+# binary-mode fetch. Single fetches use one-shot invocations instead.
+_BINARY_CLIENTS: Dict[str, _BinaryClient] = {}
+
+
+def _fetch_many_via_binary(
+    cfg: OrchestratorConfig,
+    n: int,
+    out: List[KryptonHealth],
+) -> None:
+    """
+    Fill `out` up to `n` snapshots, streaming if possible, else via `--count`.
+
+    Snapshots are appended as they arrive, so `out` keeps them if a later
+    call raises.
+    """
+    client = _binary_client(cfg)
+    if client.request(n - len(out)):
+        while len(out) < n:
+            health = client.read()
+            if health is None:
+                break
+            out.append(health)
+
+    if len(out) < n:
+        _fetch_batch_via_binary_once(cfg, n, out)
+
+
+def _binary_client(cfg: OrchestratorConfig) -> _BinaryClient:
+    path = cfg.krypton.binary_path
+    client = _BINARY_CLIENTS.get(path)
+    if client is None:
+        client = _BINARY_CLIENTS[path] = _BinaryClient(path)
+    return client
+
+
+def _fetch_via_binary_once(cfg: OrchestratorConfig) -> KryptonHealth:
     """
     Call the entropy_health binary and parse JSON.
 
@@ -92,22 +284,24 @@ def _fetch_via_binary(cfg: OrchestratorConfig) -> KryptonHealth:
 
     If the call fails or output cannot be parsed, this function raises.
     """
+    import subprocess
+
     cmd = [cfg.krypton.binary_path]
 
+    # Keep stdout as bytes end-to-end; orjson parses bytes without a decode.
     proc = subprocess.run(
         cmd,
         check=True,
         capture_output=True,
-        text=True,
     )
 
-    stdout = proc.stdout.strip()
-    if not stdout:
+    last = _last_line(proc.stdout)
+    if not last:
         raise RuntimeError("entropy_health produced no output")
 
     try:
-        payload = json.loads(stdout.splitlines()[-1])
-    except json.JSONDecodeError as exc:
+        payload = orjson.loads(last)
+    except orjson.JSONDecodeError as exc:
         raise RuntimeError(f"Failed to decode entropy_health JSON: {exc}") from exc
 
     if not isinstance(payload, dict):
@@ -116,6 +310,65 @@ def _fetch_via_binary(cfg: OrchestratorConfig) -> KryptonHealth:
     return _from_payload(payload)
 
 
+# Binaries that exited with an error for `--count N`; batched fetches from
+# them go straight to one plain invocation per snapshot.
+_NO_COUNT_BINARIES: Set[str] = set()
+
+
+def _fetch_batch_via_binary_once(
+    cfg: OrchestratorConfig,
+    n: int,
+    out: List[KryptonHealth],
+) -> None:
+    """
+    Fill `out` up to `n` snapshots with one `entropy_health --count K` call.
+
+    Every output line holding a JSON object is one snapshot; other lines are
+    ignored. If the binary rejects `--count` (remembered, so it is not tried
+    again) or returns fewer snapshots, the rest are fetched one invocation at
+    a time.
+    """
+    import subprocess
+
+    path = cfg.krypton.binary_path
+    missing = n - len(out)
+    if missing > 1 and path not in _NO_COUNT_BINARIES:
+        try:
+            proc = subprocess.run(
+                [path, "--count", str(missing)],
+                check=True,
+                capture_output=True,
+            )
+        except subprocess.CalledProcessError:
+            _NO_COUNT_BINARIES.add(path)
+        else:
+            for line in proc.stdout.splitlines():
+                if len(out) == n:
+                    break
+                try:
+                    payload = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    continue
+                if isinstance(payload, dict):
+                    out.append(_from_payload(payload))
+
+    while len(out) < n:
+        out.append(_fetch_via_binary_once(cfg))
+
+
+def _from_http_payload(payload: Any) -> KryptonHealth:
+    if not isinstance(payload, dict):
+        raise RuntimeError("HTTP /health did not return a JSON object")
+
+    # If the Go gateway shape is used, drill into the nested 'krypton' object.
+    if "krypton" in payload and isinstance(payload["krypton"], dict):
+        inner = payload["krypton"]
+        return _from_payload(inner)
+
+    # Otherwise, treat the top-level payload as the health object.
+    return _from_payload(payload)
+
+
 def _fetch_via_http(cfg: OrchestratorConfig) -> KryptonHealth:
     """
     Call an HTTP `/health` endpoint and parse JSON.
@@ -128,44 +381,158 @@ def _fetch_via_http(cfg: OrchestratorConfig) -> KryptonHealth:
     2) Nested JSON (Go gateway):
        { "krypton": { "samples": ..., "mean": ..., "variance": ..., "jitter": ..., "decision": ... }, ... }
     """
-    resp = requests.get(cfg.krypton.http_url, timeout=1.0)
+    resp = get_session().get(cfg.krypton.http_url, timeout=1.0)
     resp.raise_for_status()
-    payload = resp.json()
+    return _from_http_payload(resp.json())
 
-    if not isinstance(payload, dict):
-        raise RuntimeError("HTTP /health did not return a JSON object")
 
-    # If the Go gateway shape is used, drill into the nested 'krypton' object.
-    if "krypton" in payload and isinstance(payload["krypton"], dict):
-        inner = payload["krypton"]
-        return _from_payload(inner)
+# Endpoints that rejected `?count=N` with a 4xx; batched fetches against them
+# go straight to one plain request per snapshot.
+_NO_COUNT_URLS: Set[str] = set()
 
-    # Otherwise, treat the top-level payload as the health object.
-    return _from_payload(payload)
 
+def _fetch_many_via_http(
+    cfg: OrchestratorConfig,
+    n: int,
+    out: List[KryptonHealth],
+) -> None:
+    """
+    Fill `out` up to `n` snapshots, batching via `?count=N` where supported.
 
-def fetch() -> KryptonHealth:
+    Endpoints that ignore `count` return a single object; endpoints that
+    answer it with an HTTP error get plain requests instead (and are
+    remembered on a 4xx). Either way the remaining snapshots are fetched one
+    request at a time. Snapshots are appended as they arrive, so `out` keeps
+    them if a later request raises.
     """
-    Fetch a KryptonHealth snapshot using the configured mode.
+    url = cfg.krypton.http_url
 
-    If anything fails, logs a warning to stderr and returns a stub `Keep` snapshot.
+    if n > 1 and url not in _NO_COUNT_URLS:
+        resp = get_session().get(url, params={"count": n}, timeout=1.0)
+        if resp.ok:
+            payload = resp.json()
+            items = payload[:n] if isinstance(payload, list) else [payload]
+            for item in items:
+                out.append(_from_http_payload(item))
+        elif 400 <= resp.status_code < 500:
+            _NO_COUNT_URLS.add(url)
+
+    while len(out) < n:
+        out.append(_fetch_via_http(cfg))
+
+
+class KryptonClient:
     """
-    cfg = load_config()
+    Fetches KryptonHealth snapshots for a fixed config.
 
-    try:
-        if cfg.krypton.mode == "binary":
-            return _fetch_via_binary(cfg)
-        elif cfg.krypton.mode == "http":
-            return _fetch_via_http(cfg)
-        else:
-            print(
-                f"[krypton-client] Unknown mode '{cfg.krypton.mode}', using stub.",
-                file=sys.stderr,
-            )
-            return _stub_health()
-    except Exception as exc:  # noqa: BLE001
+    The binary/http dispatch is resolved once at construction, so repeated
+    `fetch()` calls (e.g. in `run-loop`) do not re-check the configured mode.
+    """
+
+    def __init__(self, cfg: OrchestratorConfig) -> None:
+        self.cfg = cfg
+        impls: Dict[str, Callable[[], KryptonHealth]] = {
+            "binary": self._via_binary,
+            "http": self._via_http,
+        }
+        self._impl = impls.get(cfg.krypton.mode, self._via_stub)
+        many_impls: Dict[str, Callable[[int, List[KryptonHealth]], None]] = {
+            "binary": self._many_via_binary,
+            "http": self._many_via_http,
+        }
+        self._many_impl = many_impls.get(cfg.krypton.mode, self._many_via_stub)
+
+    def _via_binary(self) -> KryptonHealth:
+        # A single snapshot is cheaper as one invocation than as a stream
+        # process that has to be started and torn down again.
+        return _fetch_via_binary_once(self.cfg)
+
+    def _via_http(self) -> KryptonHealth:
+        return _fetch_via_http(self.cfg)
+
+    def _via_stub(self) -> KryptonHealth:
         print(
-            f"[krypton-client] Error talking to Krypton ({exc!r}), using stub.",
+            f"[krypton-client] Unknown mode '{self.cfg.krypton.mode}', using stub.",
             file=sys.stderr,
         )
         return _stub_health()
+
+    def _many_via_binary(self, n: int, out: List[KryptonHealth]) -> None:
+        _fetch_many_via_binary(self.cfg, n, out)
+
+    def _many_via_http(self, n: int, out: List[KryptonHealth]) -> None:
+        _fetch_many_via_http(self.cfg, n, out)
+
+    def _many_via_stub(self, n: int, out: List[KryptonHealth]) -> None:
+        out.extend([self._via_stub()] * (n - len(out)))
+
+    def fetch(self) -> KryptonHealth:
+        """
+        Fetch a snapshot; on any failure, log to stderr and return a stub `Keep`.
+        """
+        try:
+            return self._impl()
+        except Exception as exc:  # noqa: BLE001
+            print(
+                f"[krypton-client] Error talking to Krypton ({exc!r}), using stub.",
+                file=sys.stderr,
+            )
+            return _stub_health()
+
+    def fetch_many(self, n: int) -> List[KryptonHealth]:
+        """
+        Fetch `n` snapshots in as few round-trips as the source allows.
+
+        Always returns exactly `n` snapshots. On a failure, snapshots already
+        fetched are kept, the error is logged to stderr, and only the missing
+        ones are filled with stub `Keep` snapshots.
+        """
+        healths: List[KryptonHealth] = []
+        if n <= 0:
+            return healths
+        try:
+            self._many_impl(n, healths)
+        except Exception as exc:  # noqa: BLE001
+            missing = n - len(healths)
+            print(
+                f"[krypton-client] Error talking to Krypton ({exc!r}), "
+                f"using stub for {missing} of {n} snapshots.",
+                file=sys.stderr,
+            )
+            healths.extend([_stub_health()] * missing)
+        return healths
+
+
+# Process-wide client, rebuilt only when a different config object is used.
+_CLIENT: KryptonClient | None = None
+
+
+def get_client(cfg: OrchestratorConfig | None = None) -> KryptonClient:
+    """
+    Return the shared KryptonClient for `cfg` (the loaded config by default).
+    """
+    global _CLIENT
+    if cfg is None:
+        cfg = load_config()
+    if _CLIENT is None or _CLIENT.cfg is not cfg:
+        _CLIENT = KryptonClient(cfg)
+    return _CLIENT
+
+
+def fetch(cfg: OrchestratorConfig | None = None) -> KryptonHealth:
+    """
+    Fetch a KryptonHealth snapshot using the configured mode.
+
+    Pass `cfg` to reuse an already-loaded config (e.g. across `run-loop`
+    iterations); otherwise it is loaded via `load_config()`.
+
+    If anything fails, logs a warning to stderr and returns a stub `Keep` snapshot.
+    """
+    return get_client(cfg).fetch()
+
+
+def fetch_many(n: int, cfg: OrchestratorConfig | None = None) -> List[KryptonHealth]:
+    """
+    Fetch `n` KryptonHealth snapshots, batching round-trips where possible.
+    """
+    return get_client(cfg).fetch_many(n)
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-import json
-import time
+import operator
+import sys
 from dataclasses import dataclass
-from typing import Callable, Dict, Tuple
+from typing import Any, Callable, Dict, Tuple
+
+import orjson
 
 from .config import SchedulerConfig, load_config
 from .krypton_client import KryptonHealth, fetch as fetch_krypton
@@ -11,16 +13,25 @@ from .krypton_client import KryptonHealth, fetch as fetch_krypton
 
 Job = Callable[[], None]
 
+# Field order used whenever a KryptonHealth is rendered as JSON. Kept in
+# alphabetical order so output is canonical without sorting keys on dump.
+_HEALTH_FIELDS = ("decision", "jitter", "mean", "samples", "variance")
+_health_values = operator.attrgetter(*_HEALTH_FIELDS)
+
+# Sentinel for registry lookups, so a registered value is never mistaken for
+# a missing job.
+_MISSING = object()
+
 
-@dataclass
+@dataclass(slots=True)
 class JobRegistry:
     jobs: Dict[str, Job]
 
     def get(self, job_id: str) -> Job:
-        try:
-            return self.jobs[job_id]
-        except KeyError as exc:
-            raise KeyError(f"unknown job_id {job_id!r}") from exc
+        job = self.jobs.get(job_id, _MISSING)
+        if job is _MISSING:
+            raise KeyError(f"unknown job_id {job_id!r}")
+        return job  # type: ignore[return-value]
 
 
 def run_once(
@@ -46,6 +57,8 @@ def run_once(
         return health, action
 
     if health.decision == "Throttle":
+        import time
+
         time.sleep(scheduler_cfg.throttle_sleep_seconds)
         job()
         action = "throttled"
@@ -68,21 +81,44 @@ def run_registered_once(
     return run_once(job, scheduler_cfg=scheduler_cfg)
 
 
+def health_to_dict(health: KryptonHealth) -> Dict[str, Any]:
+    """
+    Convert a KryptonHealth snapshot into a plain dict for JSON output.
+    """
+    return dict(zip(_HEALTH_FIELDS, _health_values(health)))
+
+
+def emit_json(obj: Any, *, sort_keys: bool = False) -> None:
+    """
+    Write `obj` as indented JSON plus a newline to stdout in a single write.
+
+    Payloads built by this package already use canonical key order; pass
+    `sort_keys=True` only for external data.
+
+    Serialization follows orjson: NaN/Infinity floats are written as `null`
+    (stdlib json would emit non-standard `NaN`), and integers wider than
+    64 bits raise `orjson.JSONEncodeError` before anything is written.
+    """
+    option = orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+
+    blob = orjson.dumps(obj, option=option)
+
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        # Text-only streams, e.g. contextlib.redirect_stdout(io.StringIO()).
+        sys.stdout.write(blob.decode())
+        return
+
+    # Flush pending text output (e.g. from a job) before writing raw bytes,
+    # so ordering on stdout is preserved.
+    sys.stdout.flush()
+    buffer.write(blob)
+
+
 def print_result(health: KryptonHealth, action: str) -> None:
     """
     Utility for CLI: print a JSON summary of the last iteration.
     """
-    print(
-        json.dumps(
-            {
-                "samples": health.samples,
-                "mean": health.mean,
-                "variance": health.variance,
-                "jitter": health.jitter,
-                "decision": health.decision,
-                "action": action,
-            },
-            indent=2,
-            sort_keys=True,
-        )
-    )
+    emit_json({"action": action, **health_to_dict(health)})
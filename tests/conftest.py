@@ -0,0 +1,17 @@
+import pytest
+
+from boundary_orchestrator.krypton_client import KryptonHealth
+
+
+@pytest.fixture
+def make_health():
+    def _make_health(decision: str) -> KryptonHealth:
+        return KryptonHealth(
+            samples=10,
+            mean=0.5,
+            variance=0.1,
+            jitter=0.01,
+            decision=decision,  # type: ignore[arg-type]
+        )
+
+    return _make_health
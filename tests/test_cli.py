@@ -0,0 +1,100 @@
+import json
+
+from boundary_orchestrator import cli, krypton_client
+
+
+class _FakeClient:
+    def __init__(self, decisions, make_health):
+        self._decisions = list(decisions)
+        self._make_health = make_health
+
+    def fetch_many(self, n):
+        batch, self._decisions = self._decisions[:n], self._decisions[n:]
+        return [self._make_health(d) for d in batch]
+
+
+def test_run_loop_counts_decisions_and_actions(monkeypatch, capsys, make_health):
+    decisions = ["Keep", "Throttle", "Kill", "Keep", "Weird"]
+    monkeypatch.setattr(
+        krypton_client,
+        "get_client",
+        lambda cfg=None: _FakeClient(decisions, make_health),
+    )
+
+    assert cli.main(["run-loop", "--job-id", "dummy", "--iterations", "5"]) == 0
+
+    out = capsys.readouterr().out
+    # The dummy job runs for everything except Kill.
+    assert out.count("dummy_job executed") == 4
+
+    summary = json.loads(out[out.index("{"):])
+    # Output is emitted in canonical (sorted) key order.
+    assert list(summary) == ["actions", "decisions", "iterations", "last_health"]
+    assert list(summary["decisions"]) == sorted(summary["decisions"])
+    assert list(summary["last_health"]) == sorted(summary["last_health"])
+    assert summary["iterations"] == 5
+    assert summary["decisions"] == {"Keep": 2, "Throttle": 1, "Kill": 1, "Weird": 1}
+    assert summary["actions"] == {"run": 3, "throttled": 1, "skipped": 1}
+    assert summary["last_health"]["decision"] == "Weird"
+
+
+def test_parse_fast_handles_common_invocations():
+    args = cli._parse_fast(["run-loop", "--job-id", "dummy", "--iterations=3"])
+    assert args is not None
+    assert args.func is cli.cmd_run_loop
+    assert (args.job_id, args.iterations) == ("dummy", 3)
+
+    args = cli._parse_fast(["run-loop", "--job-id=gateway"])
+    assert args is not None
+    assert args.iterations == 10
+
+    assert cli._parse_fast(["health"]).func is cli.cmd_health
+
+
+def test_parse_fast_defers_everything_else_to_argparse():
+    assert cli._parse_fast([]) is None
+    assert cli._parse_fast(["run-job"]) is None
+    assert cli._parse_fast(["run-loop", "--job-id", "x", "--iterations", "ten"]) is None
+    assert cli._parse_fast(["run-loop", "--job-id", "x", "--help"]) is None
+    assert cli._parse_fast(["bogus"]) is None
+
+
+def test_main_reports_argparse_errors(capsys):
+    try:
+        cli.main(["run-job"])
+    except SystemExit as exc:
+        assert exc.code == 2
+    else:
+        raise AssertionError("expected SystemExit for missing --job-id")
+
+    assert "--job-id" in capsys.readouterr().err
+
+
+def test_run_loop_silent_skips_dummy_output(monkeypatch, capsys, make_health):
+    monkeypatch.setattr(
+        krypton_client,
+        "get_client",
+        lambda cfg=None: _FakeClient(["Keep"] * 3, make_health),
+    )
+
+    argv = ["run-loop", "--job-id", "dummy", "--iterations", "3", "--silent"]
+    assert cli.main(argv) == 0
+
+    out = capsys.readouterr().out
+    assert "dummy_job executed" not in out
+    assert json.loads(out)["actions"]["run"] == 3
+
+
+def test_dummy_silent_env_applies_to_run_once(monkeypatch, capsys, make_health):
+    monkeypatch.setenv("KBO_DUMMY_SILENT", "1")
+    monkeypatch.setattr(cli, "_REGISTRY", None)
+    monkeypatch.setattr(
+        "boundary_orchestrator.scheduler.fetch_krypton",
+        lambda: make_health("Keep"),
+    )
+
+    assert cli.main(["run-once"]) == 0
+
+    out = capsys.readouterr().out
+    assert "dummy_job executed" not in out
+    assert json.loads(out)["action"] == "run"
@@ -0,0 +1,60 @@
+import dataclasses
+
+import pytest
+
+from boundary_orchestrator.config import load_config
+
+
+@pytest.fixture(autouse=True)
+def _clear_config_cache():
+    load_config.cache_clear()
+    yield
+    load_config.cache_clear()
+
+
+def test_load_config_is_cached(tmp_path):
+    cfg_path = tmp_path / "boundary-orchestrator.toml"
+    cfg_path.write_text('[scheduler]\nthrottle_sleep_seconds = 0.25\n')
+
+    first = load_config(str(cfg_path))
+
+    # Changing the file must not be observed until the cache is cleared.
+    cfg_path.write_text('[scheduler]\nthrottle_sleep_seconds = 1.5\n')
+    assert load_config(str(cfg_path)) is first
+    assert first.scheduler.throttle_sleep_seconds == 0.25
+
+    load_config.cache_clear()
+    reloaded = load_config(str(cfg_path))
+    assert reloaded.scheduler.throttle_sleep_seconds == 1.5
+
+
+def test_load_config_missing_file_uses_defaults(tmp_path):
+    cfg = load_config(tmp_path / "missing.toml")
+
+    assert cfg.krypton.mode == "binary"
+    assert cfg.scheduler.throttle_sleep_seconds == 0.5
+
+
+def test_cached_config_is_immutable(tmp_path):
+    cfg = load_config(tmp_path / "missing.toml")
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        cfg.scheduler.throttle_sleep_seconds = 0.0  # type: ignore[misc]
+
+
+def test_load_config_normalizes_path_spellings(tmp_path, monkeypatch):
+    (tmp_path / "boundary-orchestrator.toml").write_text(
+        '[scheduler]\nthrottle_sleep_seconds = 0.25\n'
+    )
+    monkeypatch.chdir(tmp_path)
+
+    default = load_config()
+    assert load_config("boundary-orchestrator.toml") is default
+    assert load_config(tmp_path / "boundary-orchestrator.toml") is default
+
+    # A relative default must not serve stale config after changing directory.
+    other = tmp_path / "other"
+    other.mkdir()
+    monkeypatch.chdir(other)
+    assert load_config() is not default
+    assert load_config().scheduler.throttle_sleep_seconds == 0.5
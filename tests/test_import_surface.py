@@ -0,0 +1,38 @@
+import subprocess
+import sys
+
+# Modules that must only be imported when a code path actually needs them.
+LAZY_MODULES = ("argparse", "requests", "subprocess")
+
+
+def _loaded_after_import(module: str) -> list[str]:
+    code = (
+        "import sys\n"
+        f"import {module}\n"
+        f"print(' '.join(m for m in {LAZY_MODULES!r} if m in sys.modules))\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return proc.stdout.split()
+
+
+def test_cli_import_stays_lean():
+    assert _loaded_after_import("boundary_orchestrator.cli") == []
+
+
+def test_package_import_does_not_load_submodules():
+    code = (
+        "import sys, boundary_orchestrator\n"
+        "print(' '.join(m for m in sys.modules if m.startswith('boundary_orchestrator.')))\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    assert proc.stdout.split() == []
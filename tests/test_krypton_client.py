@@ -1,4 +1,10 @@
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
 from boundary_orchestrator import krypton_client
+from boundary_orchestrator.config import KryptonConfig, OrchestratorConfig, SchedulerConfig
 from boundary_orchestrator.krypton_client import KryptonHealth
 
 
@@ -21,3 +27,249 @@ def test_fetch_returns_krypton_health():
     assert health.jitter >= 0.0
 
     assert health.decision in ("Keep", "Throttle", "Kill")
+
+
+def _write_fake_binary(tmp_path, body: str):
+    script = tmp_path / "entropy_health"
+    script.write_text(f"#!{sys.executable}\n{body}")
+    script.chmod(0o755)
+    return str(script)
+
+
+def _binary_cfg(binary_path: str) -> OrchestratorConfig:
+    return OrchestratorConfig(
+        krypton=KryptonConfig(mode="binary", binary_path=binary_path, http_url=""),
+        scheduler=SchedulerConfig(throttle_sleep_seconds=0.0),
+    )
+
+
+def test_binary_mode_reuses_streaming_process(tmp_path):
+    binary = _write_fake_binary(
+        tmp_path,
+        "import itertools, json, sys\n"
+        "assert '--stream' in sys.argv\n"
+        "for i in itertools.count(1):\n"
+        "    if not sys.stdin.readline():\n"
+        "        break\n"
+        "    print(json.dumps({'samples': i, 'mean': 0.5, 'variance': 0.1,"
+        " 'jitter': 0.01, 'decision': 'Throttle'}), flush=True)\n",
+    )
+    cfg = _binary_cfg(binary)
+
+    try:
+        first = krypton_client.fetch_many(3, cfg=cfg)
+        second = krypton_client.fetch_many(2, cfg=cfg)
+        # Consecutive lines from a single process, not fresh invocations.
+        assert [h.samples for h in first + second] == [1, 2, 3, 4, 5]
+        assert krypton_client._BINARY_CLIENTS[binary].streaming
+    finally:
+        krypton_client._BINARY_CLIENTS.pop(binary).close()
+
+
+def test_streaming_snapshots_are_taken_on_request(tmp_path):
+    decision_file = tmp_path / "decision"
+    decision_file.write_text("Keep")
+    binary = _write_fake_binary(
+        tmp_path,
+        "import json, sys\n"
+        "for _ in sys.stdin:\n"
+        f"    decision = open({str(decision_file)!r}).read()\n"
+        "    print(json.dumps({'samples': 1, 'mean': 0.5, 'variance': 0.1,"
+        " 'jitter': 0.01, 'decision': decision}), flush=True)\n",
+    )
+    cfg = _binary_cfg(binary)
+
+    try:
+        first = krypton_client.fetch_many(3, cfg=cfg)
+        decision_file.write_text("Kill")
+        second = krypton_client.fetch_many(3, cfg=cfg)
+    finally:
+        krypton_client._BINARY_CLIENTS.pop(binary).close()
+
+    # No snapshots are queued ahead of time: the new decision applies at once.
+    assert [h.decision for h in first] == ["Keep"] * 3
+    assert [h.decision for h in second] == ["Kill"] * 3
+
+
+def test_binary_mode_falls_back_without_stream_support(tmp_path):
+    binary = _write_fake_binary(
+        tmp_path,
+        "import json, sys\n"
+        "if '--stream' in sys.argv:\n"
+        "    sys.exit('unknown flag')\n"
+        "print('warming up')\n"
+        "print(json.dumps({'samples': 42, 'mean': 0.5, 'variance': 0.1,"
+        " 'jitter': 0.01, 'decision': 'Kill'}))\n",
+    )
+    cfg = _binary_cfg(binary)
+
+    # Single fetches are one-shot and never start a streaming process.
+    health = krypton_client.fetch(cfg=cfg)
+    assert (health.samples, health.decision) == (42, "Kill")
+    assert binary not in krypton_client._BINARY_CLIENTS
+
+    try:
+        healths = krypton_client.fetch_many(2, cfg=cfg)
+        assert [(h.samples, h.decision) for h in healths] == [(42, "Kill")] * 2
+        assert not krypton_client._BINARY_CLIENTS[binary].streaming
+    finally:
+        krypton_client._BINARY_CLIENTS.pop(binary).close()
+
+
+def test_client_unknown_mode_uses_stub():
+    cfg = OrchestratorConfig(
+        krypton=KryptonConfig(mode="carrier-pigeon", binary_path="", http_url=""),  # type: ignore[arg-type]
+        scheduler=SchedulerConfig(throttle_sleep_seconds=0.0),
+    )
+
+    client = krypton_client.get_client(cfg)
+    assert krypton_client.get_client(cfg) is client
+
+    health = client.fetch()
+    assert health.decision == "Keep"
+    assert health.samples == 1024
+
+
+def test_fetch_many_batches_with_count_flag(tmp_path):
+    calls = tmp_path / "calls"
+    binary = _write_fake_binary(
+        tmp_path,
+        "import json, sys\n"
+        f"open({str(calls)!r}, 'a').write(' '.join(sys.argv[1:]) + '\\n')\n"
+        "if '--stream' in sys.argv:\n"
+        "    sys.exit('unknown flag')\n"
+        "n = int(sys.argv[2]) if sys.argv[1:2] == ['--count'] else 1\n"
+        "for i in range(n):\n"
+        "    print(json.dumps({'samples': i, 'mean': 0.5, 'variance': 0.1,"
+        " 'jitter': 0.01, 'decision': 'Keep'}))\n",
+    )
+    cfg = _binary_cfg(binary)
+
+    try:
+        healths = krypton_client.fetch_many(5, cfg=cfg)
+        assert [h.samples for h in healths] == [0, 1, 2, 3, 4]
+        # One failed streaming probe, then a single batched invocation.
+        assert calls.read_text().splitlines() == ["--stream", "--count 5"]
+    finally:
+        krypton_client._BINARY_CLIENTS.pop(binary).close()
+
+
+def test_from_payload_fills_missing_fields_with_defaults():
+    full = krypton_client._from_payload(
+        {"samples": 3, "mean": 1, "variance": 0, "jitter": 0, "decision": "Kill"}
+    )
+    assert full == KryptonHealth(3, 1.0, 0.0, 0.0, "Kill")
+    assert isinstance(full.mean, float)
+
+    partial = krypton_client._from_payload({"samples": 3, "decision": "Throttle"})
+    assert partial == KryptonHealth(3, 0.0, 0.0, 0.0, "Throttle")
+
+
+def test_streaming_client_kills_binary_that_ignores_sigterm(tmp_path, monkeypatch):
+    binary = _write_fake_binary(
+        tmp_path,
+        "import signal, time\n"
+        "signal.signal(signal.SIGTERM, signal.SIG_IGN)\n"
+        "print('{}', flush=True)\n"
+        "time.sleep(60)\n",
+    )
+    monkeypatch.setattr(krypton_client, "_STREAM_CLOSE_TIMEOUT_SECONDS", 0.1)
+
+    client = krypton_client._BinaryClient(binary)
+    # Wait until the child is up (and ignoring SIGTERM) before closing it.
+    assert client._proc.stdout.readline() == b"{}\n"
+
+    client.close()
+    assert client._proc.returncode is not None
+    assert client._proc.stdout.closed
+
+
+def test_fetch_many_keeps_real_snapshots_when_top_up_fails(tmp_path):
+    binary = _write_fake_binary(
+        tmp_path,
+        "import json, sys\n"
+        "if '--stream' not in sys.argv:\n"
+        "    sys.exit(1)\n"
+        "for i in range(2):\n"
+        "    sys.stdin.readline()\n"
+        "    print(json.dumps({'samples': i, 'mean': 0.5, 'variance': 0.1,"
+        " 'jitter': 0.01, 'decision': 'Kill'}), flush=True)\n",
+    )
+    cfg = _binary_cfg(binary)
+
+    try:
+        healths = krypton_client.fetch_many(4, cfg=cfg)
+    finally:
+        krypton_client._BINARY_CLIENTS.pop(binary).close()
+
+    # The two streamed Kill snapshots survive; only the rest are stubs.
+    assert [h.decision for h in healths] == ["Kill", "Kill", "Keep", "Keep"]
+
+
+def test_fetch_many_http_retries_without_count_on_error():
+    requests_seen = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requests_seen.append(self.path)
+            if "?" in self.path:
+                self.send_response(400)
+                self.end_headers()
+                return
+            body = json.dumps(
+                {"krypton": {"samples": 1, "mean": 0.5, "variance": 0.1,
+                             "jitter": 0.01, "decision": "Kill"}}
+            ).encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_port}/health"
+    cfg = OrchestratorConfig(
+        krypton=KryptonConfig(mode="http", binary_path="", http_url=url),
+        scheduler=SchedulerConfig(throttle_sleep_seconds=0.0),
+    )
+
+    try:
+        first = krypton_client.fetch_many(2, cfg=cfg)
+        second = krypton_client.fetch_many(2, cfg=cfg)
+    finally:
+        server.shutdown()
+        server.server_close()
+        krypton_client._NO_COUNT_URLS.discard(url)
+
+    assert [h.decision for h in first + second] == ["Kill"] * 4
+    # `count` is tried once, then remembered as unsupported.
+    assert requests_seen == ["/health?count=2"] + ["/health"] * 4
+
+
+def test_fetch_many_remembers_binary_without_count_support(tmp_path):
+    calls = tmp_path / "calls"
+    binary = _write_fake_binary(
+        tmp_path,
+        "import json, sys\n"
+        f"open({str(calls)!r}, 'a').write(' '.join(sys.argv[1:]) + '\\n')\n"
+        "if sys.argv[1:]:\n"
+        "    sys.exit('unknown flag')\n"
+        "print(json.dumps({'samples': 1, 'mean': 0.5, 'variance': 0.1,"
+        " 'jitter': 0.01, 'decision': 'Kill'}))\n",
+    )
+    cfg = _binary_cfg(binary)
+
+    try:
+        for _ in range(2):
+            healths = krypton_client.fetch_many(2, cfg=cfg)
+            assert [h.decision for h in healths] == ["Kill", "Kill"]
+    finally:
+        krypton_client._BINARY_CLIENTS.pop(binary).close()
+        krypton_client._NO_COUNT_BINARIES.discard(binary)
+
+    # `--stream` and `--count` are each tried once; then only plain calls.
+    assert calls.read_text().splitlines() == ["--stream", "--count 2"] + [""] * 4
@@ -1,27 +1,20 @@
+import contextlib
+import io
+import json
+
 from boundary_orchestrator import scheduler
 from boundary_orchestrator.config import SchedulerConfig
-from boundary_orchestrator.krypton_client import KryptonHealth
 from boundary_orchestrator.scheduler import JobRegistry
 
 
-def _make_health(decision: str) -> KryptonHealth:
-    return KryptonHealth(
-        samples=10,
-        mean=0.5,
-        variance=0.1,
-        jitter=0.01,
-        decision=decision,  # type: ignore[arg-type]
-    )
-
-
-def test_run_once_keep(monkeypatch):
+def test_run_once_keep(monkeypatch, make_health):
     calls = []
 
     def fake_job():
         calls.append("job")
 
     def fake_fetch():
-        return _make_health("Keep")
+        return make_health("Keep")
 
     monkeypatch.setattr("boundary_orchestrator.scheduler.fetch_krypton", fake_fetch)
 
@@ -33,14 +26,14 @@ def test_run_once_keep(monkeypatch):
     assert calls == ["job"]
 
 
-def test_run_once_throttle(monkeypatch):
+def test_run_once_throttle(monkeypatch, make_health):
     calls = []
 
     def fake_job():
         calls.append("job")
 
     def fake_fetch():
-        return _make_health("Throttle")
+        return make_health("Throttle")
 
     monkeypatch.setattr("boundary_orchestrator.scheduler.fetch_krypton", fake_fetch)
 
@@ -52,14 +45,14 @@ def test_run_once_throttle(monkeypatch):
     assert calls == ["job"]
 
 
-def test_run_once_kill(monkeypatch):
+def test_run_once_kill(monkeypatch, make_health):
     calls = []
 
     def fake_job():
         calls.append("job")
 
     def fake_fetch():
-        return _make_health("Kill")
+        return make_health("Kill")
 
     monkeypatch.setattr("boundary_orchestrator.scheduler.fetch_krypton", fake_fetch)
 
@@ -72,7 +65,7 @@ def test_run_once_kill(monkeypatch):
     assert calls == []
 
 
-def test_run_registered_once_uses_registry(monkeypatch):
+def test_run_registered_once_uses_registry(monkeypatch, make_health):
     calls = []
 
     def fake_job():
@@ -81,7 +74,7 @@ def test_run_registered_once_uses_registry(monkeypatch):
     registry = JobRegistry(jobs={"demo": fake_job})
 
     def fake_fetch():
-        return _make_health("Keep")
+        return make_health("Keep")
 
     monkeypatch.setattr("boundary_orchestrator.scheduler.fetch_krypton", fake_fetch)
 
@@ -102,3 +95,30 @@ def test_run_registered_once_unknown_job():
         assert "unknown job_id" in str(exc)
     else:
         raise AssertionError("expected KeyError for unknown job_id")
+
+
+def test_health_to_dict_round_trips_fields(make_health):
+    health = make_health("Throttle")
+
+    assert scheduler.health_to_dict(health) == {
+        "samples": 10,
+        "mean": 0.5,
+        "variance": 0.1,
+        "jitter": 0.01,
+        "decision": "Throttle",
+    }
+
+
+def test_print_result_works_with_text_only_stdout(make_health):
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        scheduler.print_result(make_health("Kill"), "skipped")
+
+    assert json.loads(out.getvalue()) == {
+        "action": "skipped",
+        "decision": "Kill",
+        "jitter": 0.01,
+        "mean": 0.5,
+        "samples": 10,
+        "variance": 0.1,
+    }